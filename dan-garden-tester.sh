@@ -511,10 +511,9 @@ Simplified version with core functionality for testing
 
 import os
 import sys
-import json
+import re
 import datetime
-import subprocess
-import shutil
+import functools
 from pathlib import Path
 
 # Colors for terminal output
@@ -529,20 +528,56 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# Message prefixes with their colors applied, built once at import
+HEADER_PREFIX = f"\n{Colors.HEADER}{Colors.BOLD}🌱 "
+SUCCESS_PREFIX = f"{Colors.OKGREEN}✅ "
+WARNING_PREFIX = f"{Colors.WARNING}⚠️  "
+ERROR_PREFIX = f"{Colors.FAIL}❌ "
+INFO_PREFIX = f"{Colors.OKBLUE}ℹ️  "
+COLOR_END = Colors.ENDC
+
 def print_header(text):
-    print(f"\n{Colors.HEADER}{Colors.BOLD}🌱 {text}{Colors.ENDC}")
+    print(f"{HEADER_PREFIX}{text}{COLOR_END}")
 
 def print_success(text):
-    print(f"{Colors.OKGREEN}✅ {text}{Colors.ENDC}")
+    print(f"{SUCCESS_PREFIX}{text}{COLOR_END}")
 
 def print_warning(text):
-    print(f"{Colors.WARNING}⚠️  {text}{Colors.ENDC}")
+    print(f"{WARNING_PREFIX}{text}{COLOR_END}")
 
 def print_error(text):
-    print(f"{Colors.FAIL}❌ {text}{Colors.ENDC}")
+    print(f"{ERROR_PREFIX}{text}{COLOR_END}")
 
 def print_info(text):
-    print(f"{Colors.OKBLUE}ℹ️  {text}{Colors.ENDC}")
+    print(f"{INFO_PREFIX}{text}{COLOR_END}")
+
+def iter_project_dirs(base):
+    """Yield a DirEntry for each project directory under base"""
+    with os.scandir(base) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                yield entry
+
+@functools.lru_cache(maxsize=None)
+def tool_version(name):
+    """Return `<name> --version` output, or None if the tool is unavailable (cached per session)"""
+    import shutil
+    import subprocess
+    if shutil.which(name) is None:
+        return None
+    try:
+        result = subprocess.run([name, '--version'], capture_output=True, text=True)
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+# Matches the {{PLACEHOLDER}} tokens used in TEMPLATES
+PLACEHOLDER_PATTERN = re.compile(r"\{\{([A-Z_]+)\}\}")
+
+# Valid project names: lowercase letters, numbers, and hyphens
+PROJECT_NAME_PATTERN = re.compile(r"[a-z0-9-]+")
 
 # Project templates
 TEMPLATES = {
@@ -808,8 +843,7 @@ def create_project():
         return
     
     # Validate project name
-    import re
-    if not re.match(r'^[a-z0-9-]+$', project_name):
+    if not PROJECT_NAME_PATTERN.fullmatch(project_name):
         print_error("Project name must be lowercase letters, numbers, and hyphens only")
         return
     
@@ -846,21 +880,27 @@ def create_project():
     timestamp = datetime.datetime.now().isoformat()
     
     replacements = {
-        "{{PROJECT_NAME}}": project_name,
-        "{{PROJECT_NAME_CLEAN}}": project_name.replace("-", ""),
-        "{{PROJECT_DESCRIPTION}}": description,
-        "{{TIMESTAMP}}": timestamp
+        "PROJECT_NAME": project_name,
+        "PROJECT_NAME_CLEAN": project_name.replace("-", ""),
+        "PROJECT_DESCRIPTION": description,
+        "TIMESTAMP": timestamp
     }
     
+    def substitute(match):
+        return replacements.get(match.group(1), match.group(0))
+    
+    # Create each template subdirectory once rather than per file
+    for subdir in {os.path.dirname(file_path) for file_path in template["files"]}:
+        if subdir:
+            (project_dir / subdir).mkdir(parents=True, exist_ok=True)
+    
     for file_path, content in template["files"].items():
-        # Apply replacements
-        for placeholder, value in replacements.items():
-            content = content.replace(placeholder, value)
+        # Apply replacements in a single pass over the template
+        content = PLACEHOLDER_PATTERN.sub(substitute, content)
         
         # Create file
         full_path = project_dir / file_path
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-        full_path.write_text(content, encoding='utf-8')
+        full_path.write_bytes(content.encode('utf-8'))
     
     print_success(f"Project '{project_name}' created successfully!")
     print_info(f"Location: {project_dir}")
@@ -873,13 +913,12 @@ def list_projects():
     """List all existing projects"""
     print_header("Existing Projects")
     
-    projects_dir = Path("test-projects")
-    if not projects_dir.exists():
+    try:
+        projects = sorted(iter_project_dirs("test-projects"), key=lambda entry: entry.name)
+    except FileNotFoundError:
         print_warning("No projects directory found")
         return
     
-    projects = [p for p in projects_dir.iterdir() if p.is_dir()]
-    
     if not projects:
         print_warning("No projects found")
         return
@@ -887,23 +926,22 @@ def list_projects():
     for i, project in enumerate(projects):
         print(f"{i + 1}. {project.name}")
         
-        # Try to read project info
-        readme_path = project / "README.md"
-        package_path = project / "package.json"
-        index_path = project / "index.html"
+        # Try to read project info (one directory read per project)
+        with os.scandir(project.path) as entries:
+            names = {entry.name for entry in entries}
         
-        if package_path.exists():
+        if "package.json" in names:
             try:
                 import json
-                with open(package_path) as f:
+                with open(os.path.join(project.path, "package.json")) as f:
                     pkg = json.load(f)
                 print(f"   Type: {pkg.get('name', 'Unknown')} (React/Node.js)")
                 print(f"   Description: {pkg.get('description', 'No description')}")
             except:
                 print("   Type: Node.js project")
-        elif index_path.exists():
+        elif "index.html" in names:
             print("   Type: HTML (Dan's Pattern)")
-        elif readme_path.exists():
+        elif "README.md" in names:
             print("   Type: Empty/Custom project")
         else:
             print("   Type: Unknown")
@@ -920,45 +958,47 @@ def system_status():
         print_error("Python version check failed")
     
     # Check Git
-    try:
-        result = subprocess.run(['git', '--version'], capture_output=True, text=True)
-        if result.returncode == 0:
-            print_success(f"Git: {result.stdout.strip()}")
-        else:
-            print_error("Git not available")
-    except:
+    git_version = tool_version('git')
+    if git_version:
+        print_success(f"Git: {git_version}")
+    else:
         print_error("Git not found")
     
     # Check directory structure
     dirs_to_check = ["test-projects", "test-results", "documentation"]
+    present_dirs = set()
     for dir_name in dirs_to_check:
-        if Path(dir_name).exists():
+        if os.path.isdir(dir_name):
+            present_dirs.add(dir_name)
             print_success(f"Directory {dir_name}: ✓")
         else:
             print_warning(f"Directory {dir_name}: Missing")
     
-    # Check for projects
-    projects_dir = Path("test-projects")
-    if projects_dir.exists():
-        project_count = len([p for p in projects_dir.iterdir() if p.is_dir()])
+    # Check for projects (reuse the probe above instead of another stat)
+    if "test-projects" in present_dirs:
+        project_count = sum(1 for _ in iter_project_dirs("test-projects"))
         print_info(f"Projects found: {project_count}")
     else:
         print_info("Projects found: 0")
 
+# Static main menu, written with a single stdout call per redraw
+MAIN_MENU = "\n".join([
+    f"{HEADER_PREFIX}G.A.R.D.E.N. Deploy Manager - Testing Version{COLOR_END}",
+    "🌱 Graph Algorithms, Research, Development, Enhancement, and Novelties",
+    f"{Colors.OKCYAN}Testing Environment for Dan{Colors.ENDC}\n",
+    "Available options:",
+    "1. 🛠️  Create new project",
+    "2. 📋 List existing projects",
+    "3. 🔍 System status",
+    "4. 📖 Open documentation",
+    "5. 🌐 Open web interface (if available)",
+    "0. 🚪 Exit",
+]) + "\n"
+
 def main_menu():
     """Display main menu and handle user input"""
     while True:
-        print_header("G.A.R.D.E.N. Deploy Manager - Testing Version")
-        print("🌱 Graph Algorithms, Research, Development, Enhancement, and Novelties")
-        print(f"{Colors.OKCYAN}Testing Environment for Dan{Colors.ENDC}\n")
-        
-        print("Available options:")
-        print("1. 🛠️  Create new project")
-        print("2. 📋 List existing projects")
-        print("3. 🔍 System status")
-        print("4. 📖 Open documentation")
-        print("5. 🌐 Open web interface (if available)")
-        print("0. 🚪 Exit")
+        sys.stdout.write(MAIN_MENU)
         
         try:
             choice = input(f"\n{Colors.OKBLUE}Choose option (0-5): {Colors.ENDC}").strip()
@@ -975,6 +1015,7 @@ def main_menu():
             elif choice == "4":
                 print_info("Opening documentation files...")
                 try:
+                    import subprocess
                     if sys.platform == "darwin":  # macOS
                         subprocess.run(["open", "DAN-TESTING-PLAN.md"])
                     elif sys.platform == "win32":  # Windows
@@ -17,15 +17,45 @@ import subprocess
 import tempfile
 import shutil
 import glob
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import zipfile
 import urllib.request
+import urllib.error
+
+# Static banner and menu text, written in a single call per redraw
+BANNER = (
+    "\n" + "="*60 + "\n"
+    "🌱 GARDEN Deploy Manager v2.2\n"
+    "   Project Deployment and Production Manager\n"
+    + "="*60 + "\n"
+    "🧬 GitHub Fork System - Downloads GARDEN DNA\n"
+    "🚀 Production Ready - Vercel/GitHub Integration\n"
+    "📋 Complete Templates - Recipe, Ideas, Budget\n"
+    + "="*60 + "\n\n"
+)
+
+MAIN_MENU = (
+    "🎯 Deployment Options:\n"
+    "0. 🌱 Fork New Garden Project\n"
+    "1. 🚀 Deploy Existing Project to Vercel\n"
+    "2. 🔍 Test GitHub Connection\n"
+    "3. 📋 Show Available Templates\n"
+    "4. 🧬 Show Core Files List\n"
+    "5. ❌ Exit\n"
+)
 
 class GardenDeployManager:
     def __init__(self):
         self.github_repo = "https://github.com/scottloeb/garden"
         self.current_dir = Path.cwd()
+        # Downloaded repository zip and its ETag are kept here between runs
+        self.cache_dir = Path.home() / ".cache" / "garden-deploy"
+        # Resolved Vercel CLI path, looked up on first deploy
+        self._vercel_path = None
+        # Extracted repository, shared by every fork in one run() session
+        self._garden_source = None
         
         # Core GARDEN DNA files (comprehensive v2.2)
         self.core_files = [
@@ -45,6 +75,9 @@ class GardenDeployManager:
             'requirements.txt',
             '.gitignore'
         ]
+        # Archive path matchers: directory prefixes for startswith, exact names for files
+        self._core_dir_prefixes = tuple(f for f in self.core_files if f.endswith('/'))
+        self._core_file_names = frozenset(f for f in self.core_files if not f.endswith('/'))
         
         # Project templates
         self.templates = {
@@ -73,34 +106,36 @@ class GardenDeployManager:
                 "template_type": "nodepad"
             }
         }
+        
+        # Template listings are fixed for the session, so format them once
+        self._template_keys = list(self.templates)
+        self._template_choices = "\n".join(
+            f"{i}. {name} - {template['description']}"
+            for i, (name, template) in enumerate(self.templates.items()))
+        self._templates_listing = self._format_templates_listing()
 
     def show_banner(self):
-        print("\n" + "="*60)
-        print("🌱 GARDEN Deploy Manager v2.2")
-        print("   Project Deployment and Production Manager")
-        print("="*60)
-        print("🧬 GitHub Fork System - Downloads GARDEN DNA")
-        print("🚀 Production Ready - Vercel/GitHub Integration")
-        print("📋 Complete Templates - Recipe, Ideas, Budget")
-        print("="*60 + "\n")
+        sys.stdout.write(BANNER)
 
     def show_menu(self):
-        print("🎯 Deployment Options:")
-        print("0. 🌱 Fork New Garden Project")
-        print("1. 🚀 Deploy Existing Project to Vercel")
-        print("2. 🔍 Test GitHub Connection")
-        print("3. 📋 Show Available Templates")
-        print("4. 🧬 Show Core Files List")
-        print("5. ❌ Exit")
+        sys.stdout.write(MAIN_MENU)
         return input("\n👉 Select option (0-5): ").strip()
 
+    def _github_request(self, url):
+        """Build a GitHub request, authenticated when GITHUB_TOKEN is set"""
+        request = urllib.request.Request(url)
+        token = os.environ.get('GITHUB_TOKEN')
+        if token:
+            request.add_header('Authorization', f'Bearer {token}')
+        return request
+
     def test_github_connection(self):
         """Test if we can connect to the GitHub repository"""
         print("🔍 Testing GitHub connection...")
         try:
             # Test download of a small file
             test_url = f"{self.github_repo}/raw/main/README.md"
-            with urllib.request.urlopen(test_url) as response:
+            with urllib.request.urlopen(self._github_request(test_url)) as response:
                 content = response.read().decode('utf-8')
             
             print(f"✅ Successfully connected to {self.github_repo}")
@@ -110,79 +145,127 @@ class GardenDeployManager:
             print(f"❌ Failed to connect to GitHub: {str(e)}")
             return False
 
+    def _fetch_garden_zip(self):
+        """Fetch the repository zip into the cache, reusing it when GitHub reports no change"""
+        zip_url = f"{self.github_repo}/archive/refs/heads/main.zip"
+        zip_path = self.cache_dir / "garden-main.zip"
+        etag_path = self.cache_dir / "garden-main.etag"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        request = self._github_request(zip_url)
+        if zip_path.is_file() and etag_path.is_file():
+            request.add_header('If-None-Match', etag_path.read_text().strip())
+        
+        try:
+            with urllib.request.urlopen(request) as response:
+                # Stream to disk in 1 MiB chunks, then swap in so a failed download keeps the old cache
+                with tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix='.zip', delete=False) as tmp_file:
+                    try:
+                        shutil.copyfileobj(response, tmp_file, 1024 * 1024)
+                    except BaseException:
+                        os.unlink(tmp_file.name)
+                        raise
+                os.replace(tmp_file.name, zip_path)
+                etag = response.headers.get('ETag')
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            print("✓ Cached repository is up to date")
+            return zip_path
+        
+        if etag:
+            etag_path.write_text(etag)
+        elif etag_path.exists():
+            etag_path.unlink()
+        return zip_path
+
     def download_garden_repo(self):
         """Download the GARDEN repository as a zip file"""
+        # Reuse the copy already extracted this session (removed when run() exits)
+        if self._garden_source and os.path.isdir(self._garden_source):
+            print(f"✅ Using GARDEN repository from this session: {self._garden_source}")
+            return self._garden_source
+        
         print("📥 Downloading GARDEN repository...")
         try:
-            zip_url = f"{self.github_repo}/archive/refs/heads/main.zip"
-            
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp_file:
-                with urllib.request.urlopen(zip_url) as response:
-                    tmp_file.write(response.read())
-                
-                zip_path = tmp_file.name
+            zip_path = self._fetch_garden_zip()
             
-            # Extract to temporary directory
+            # Extract only the core files (entries sit under a garden-<branch>/ prefix)
             extract_dir = tempfile.mkdtemp()
+            top_dir = None
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
+                for member in zip_ref.infolist():
+                    top_dir, _, rel_path = member.filename.partition('/')
+                    if rel_path.startswith(self._core_dir_prefixes) or rel_path in self._core_file_names:
+                        zip_ref.extract(member, extract_dir)
             
-            # Find the extracted garden directory
-            garden_dir = None
-            for item in os.listdir(extract_dir):
-                if item.startswith('garden'):
-                    garden_dir = os.path.join(extract_dir, item)
-                    break
-            
-            if not garden_dir:
+            # The garden directory is the archive's top-level prefix
+            garden_dir = os.path.join(extract_dir, top_dir) if top_dir else None
+            if not garden_dir or not os.path.isdir(garden_dir):
                 raise Exception("Could not find garden directory in downloaded zip")
             
             print(f"✅ Downloaded and extracted to: {garden_dir}")
+            self._garden_source = garden_dir
             return garden_dir
             
         except Exception as e:
             print(f"❌ Failed to download repository: {str(e)}")
             return None
-        finally:
-            # Clean up zip file
-            if 'zip_path' in locals():
-                try:
-                    os.unlink(zip_path)
-                except:
-                    pass
 
     def copy_core_files(self, source_dir, target_dir):
         """Copy core GARDEN files from source to target directory"""
         print("📋 Copying core GARDEN files...")
-        copied_count = 0
         
-        for core_file in self.core_files:
-            source_path = os.path.join(source_dir, core_file)
-            target_path = os.path.join(target_dir, core_file)
-            
-            try:
-                if os.path.isdir(source_path):
-                    # Copy entire directory
-                    if os.path.exists(target_path):
-                        shutil.rmtree(target_path)
-                    shutil.copytree(source_path, target_path)
-                    file_count = sum([len(files) for r, d, files in os.walk(target_path)])
-                    print(f"  ✓ {core_file}/ ({file_count} files)")
-                    copied_count += file_count
-                elif os.path.isfile(source_path):
-                    # Copy single file
-                    os.makedirs(os.path.dirname(target_path), exist_ok=True)
-                    shutil.copy2(source_path, target_path)
-                    print(f"  ✓ {core_file}")
-                    copied_count += 1
-                else:
-                    print(f"  ⚠️ Not found: {core_file}")
-            except Exception as e:
-                print(f"  ❌ Error copying {core_file}: {str(e)}")
+        # Create each distinct parent directory once, before the workers start
+        parent_dirs = {os.path.dirname(os.path.join(target_dir, core_file.rstrip('/')))
+                       for core_file in self.core_files
+                       if os.path.exists(os.path.join(source_dir, core_file))}
+        for parent_dir in sorted(parent_dirs):
+            os.makedirs(parent_dir, exist_ok=True)
+        
+        # Entries are independent, so copy them concurrently and report in list order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(
+                lambda core_file: self._copy_core_entry(source_dir, target_dir, core_file),
+                self.core_files))
+        
+        copied_count = 0
+        for message, count in results:
+            print(message)
+            copied_count += count
         
         print(f"📦 Copied {copied_count} core files/directories")
         return copied_count > 0
 
+    def _copy_core_entry(self, source_dir, target_dir, core_file):
+        """Copy one core file or directory, returning its report line and file count"""
+        source_path = os.path.join(source_dir, core_file)
+        target_path = os.path.join(target_dir, core_file)
+        
+        # shutil.copy keeps the kernel copy path and mode bits but skips copystat,
+        # since archive timestamps mean nothing in a fresh fork
+        try:
+            if os.path.isdir(source_path):
+                # Copy entire directory
+                if os.path.exists(target_path):
+                    shutil.rmtree(target_path)
+                # Count files as copytree copies them instead of walking the result again
+                copied = []
+                def copy_and_count(src, dst):
+                    copied.append(dst)
+                    return shutil.copy(src, dst)
+                shutil.copytree(source_path, target_path, copy_function=copy_and_count)
+                file_count = len(copied)
+                return f"  ✓ {core_file}/ ({file_count} files)", file_count
+            elif os.path.isfile(source_path):
+                # Copy single file (parent created by copy_core_files)
+                shutil.copy(source_path, target_path)
+                return f"  ✓ {core_file}", 1
+            else:
+                return f"  ⚠️ Not found: {core_file}", 0
+        except Exception as e:
+            return f"  ❌ Error copying {core_file}: {str(e)}", 0
+
     def create_template_file(self, template_name, project_dir):
         """Create the main template file for the project"""
         template = self.templates[template_name]
@@ -833,11 +916,13 @@ class GardenDeployManager:
                     const importedRecipes = JSON.parse(e.target.result);
                     
                     if (confirm(`Import ${importedRecipes.length} recipes? This will merge with existing recipes.`)) {
-                        importedRecipes.forEach(recipe => {
-                            recipe.id = generateId(); // Generate new IDs to avoid conflicts
+                        // Generate new IDs to avoid conflicts (one unique base per import)
+                        const baseId = generateId();
+                        importedRecipes.forEach((recipe, i) => {
+                            recipe.id = `${baseId}-${i}`;
                         });
                         
-                        recipes = [...recipes, ...importedRecipes];
+                        for (const recipe of importedRecipes) recipes.push(recipe);
                         saveRecipes();
                         renderRecipeList();
                         
@@ -936,11 +1021,9 @@ class GardenDeployManager:
         
         # Show available templates
         print("\n📋 Available templates:")
-        template_keys = list(self.templates.keys())
-        for i, template_name in enumerate(template_keys):
-            template = self.templates[template_name]
-            print(f"{i}. {template_name} - {template['description']}")
+        print(self._template_choices)
         
+        template_keys = self._template_keys
         try:
             template_idx = int(input(f"\n👉 Select template (0-{len(template_keys)-1}): "))
             template_name = template_keys[template_idx]
@@ -955,45 +1038,39 @@ class GardenDeployManager:
         if not garden_source:
             return
         
-        try:
-            # Create project directory
-            project_dir = os.path.join(self.current_dir, project_name)
-            if os.path.exists(project_dir):
-                if not input(f"⚠️ Directory '{project_name}' exists. Overwrite? (y/N): ").lower().startswith('y'):
-                    return
-                shutil.rmtree(project_dir)
-            
-            os.makedirs(project_dir)
-            
-            # Copy core GARDEN files
-            if not self.copy_core_files(garden_source, project_dir):
-                print("❌ Failed to copy core files")
+        # Create project directory
+        project_dir = os.path.join(self.current_dir, project_name)
+        if os.path.exists(project_dir):
+            if not input(f"⚠️ Directory '{project_name}' exists. Overwrite? (y/N): ").lower().startswith('y'):
                 return
-            
-            # Create template-specific files
-            print("🎯 Creating starter application...")
-            self.create_template_file(template_name, project_dir)
-            
-            # Initialize git repository
-            os.chdir(project_dir)
-            subprocess.run(['git', 'init'], capture_output=True)
-            print("  ✓ Git repository initialized")
-            
-            # Create project metadata
-            self.create_project_metadata(project_name, template_name, project_dir)
-            print("  ✓ Project metadata created")
-            
-            os.chdir(self.current_dir)
-            
-            print(f"\n✅ Successfully forked garden project '{project_name}'!")
-            print(f"📁 Location: {project_dir}")
-            print("🌐 Ready for: Claude project knowledge upload")
-            print("🚀 Deploy with: Option 1 (Deploy to Vercel)")
-            
-        finally:
-            # Clean up temporary directory
-            if 'garden_source' in locals():
-                shutil.rmtree(os.path.dirname(garden_source), ignore_errors=True)
+            shutil.rmtree(project_dir)
+        
+        os.makedirs(project_dir)
+        
+        # Copy core GARDEN files
+        if not self.copy_core_files(garden_source, project_dir):
+            print("❌ Failed to copy core files")
+            return
+        
+        # Create template-specific files
+        print("🎯 Creating starter application...")
+        self.create_template_file(template_name, project_dir)
+        
+        # Initialize git repository
+        os.chdir(project_dir)
+        subprocess.run(['git', 'init'], capture_output=True)
+        print("  ✓ Git repository initialized")
+        
+        # Create project metadata
+        self.create_project_metadata(project_name, template_name, project_dir)
+        print("  ✓ Project metadata created")
+        
+        os.chdir(self.current_dir)
+        
+        print(f"\n✅ Successfully forked garden project '{project_name}'!")
+        print(f"📁 Location: {project_dir}")
+        print("🌐 Ready for: Claude project knowledge upload")
+        print("🚀 Deploy with: Option 1 (Deploy to Vercel)")
 
     def deploy_to_vercel(self):
         """Deploy existing project to Vercel"""
@@ -1011,78 +1088,96 @@ class GardenDeployManager:
         
         project_name = metadata['name']
         
-        # Check if Vercel CLI is available
-        try:
-            result = subprocess.run(['vercel', '--version'], capture_output=True, text=True)
-            print(f"✅ Vercel CLI found: {result.stdout.strip()}")
-        except FileNotFoundError:
+        # Check if Vercel CLI is available (PATH lookup, remembered for the session)
+        if self._vercel_path is None:
+            self._vercel_path = shutil.which('vercel')
+        if not self._vercel_path:
             print("❌ Vercel CLI not found. Install with: npm i -g vercel")
             return
+        print(f"✅ Vercel CLI found: {self._vercel_path}")
         
         # Deploy to Vercel
         print(f"🚀 Deploying '{project_name}' to Vercel...")
         try:
-            deploy_result = subprocess.run(['vercel', '--prod'], capture_output=True, text=True)
+            # Stream the deploy log as it arrives, keeping the last URL Vercel prints
+            deploy_url = None
+            with subprocess.Popen([self._vercel_path, '--prod'], stdout=subprocess.PIPE,
+                                  stderr=subprocess.STDOUT, text=True, bufsize=1) as proc:
+                for line in proc.stdout:
+                    line = line.rstrip()
+                    print(f"   {line}")
+                    if line.startswith('https://'):
+                        deploy_url = line
             
-            if deploy_result.returncode == 0:
+            if proc.returncode == 0:
                 print("✅ Successfully deployed to Vercel!")
-                print(f"🌐 URL: {deploy_result.stdout.strip()}")
+                print(f"🌐 URL: {deploy_url or 'see output above'}")
             else:
-                print(f"❌ Deployment failed: {deploy_result.stderr}")
+                print(f"❌ Deployment failed (exit code {proc.returncode})")
                 
         except Exception as e:
             print(f"❌ Deployment error: {str(e)}")
 
     def show_templates(self):
         """Show available project templates"""
-        print("\n📋 Available Project Templates:")
-        print("="*50)
+        print(self._templates_listing)
+
+    def _format_templates_listing(self):
+        """Format the template listing shown by show_templates"""
+        lines = ["\n📋 Available Project Templates:", "="*50]
         
         for name, template in self.templates.items():
-            print(f"\n🎯 {name}")
-            print(f"   Description: {template['description']}")
-            print(f"   Main File: {template['main_file']}")
-            print(f"   Type: {template['template_type']}")
+            lines.append(f"\n🎯 {name}")
+            lines.append(f"   Description: {template['description']}")
+            lines.append(f"   Main File: {template['main_file']}")
+            lines.append(f"   Type: {template['template_type']}")
             if template['contexts']:
-                print(f"   Contexts: {', '.join(template['contexts'])}")
+                lines.append(f"   Contexts: {', '.join(template['contexts'])}")
+        
+        return "\n".join(lines)
 
     def show_core_files(self):
         """Show core GARDEN files that get forked"""
-        print("\n🧬 Core GARDEN DNA Files:")
-        print("="*50)
+        lines = ["\n🧬 Core GARDEN DNA Files:", "="*50]
         
         for core_file in self.core_files:
             if core_file.endswith('/'):
-                print(f"📁 {core_file} (entire directory)")
+                lines.append(f"📁 {core_file} (entire directory)")
             else:
-                print(f"📄 {core_file}")
+                lines.append(f"📄 {core_file}")
         
-        print(f"\n📊 Total: {len(self.core_files)} core files/directories")
+        lines.append(f"\n📊 Total: {len(self.core_files)} core files/directories")
+        print("\n".join(lines))
 
     def run(self):
         """Main application loop"""
-        while True:
-            self.show_banner()
-            choice = self.show_menu()
-            
-            if choice == '0':
-                self.fork_garden_project()
-            elif choice == '1':
-                self.deploy_to_vercel()
-            elif choice == '2':
-                self.test_github_connection()
-            elif choice == '3':
-                self.show_templates()
-            elif choice == '4':
-                self.show_core_files()
-            elif choice == '5':
-                print("👋 Goodbye!")
-                break
-            else:
-                print("❌ Invalid option")
-            
-            if choice != '5':
-                input("\n📱 Press Enter to continue...")
+        try:
+            while True:
+                self.show_banner()
+                choice = self.show_menu()
+                
+                if choice == '0':
+                    self.fork_garden_project()
+                elif choice == '1':
+                    self.deploy_to_vercel()
+                elif choice == '2':
+                    self.test_github_connection()
+                elif choice == '3':
+                    self.show_templates()
+                elif choice == '4':
+                    self.show_core_files()
+                elif choice == '5':
+                    print("👋 Goodbye!")
+                    break
+                else:
+                    print("❌ Invalid option")
+                
+                if choice != '5':
+                    input("\n📱 Press Enter to continue...")
+        finally:
+            # Remove the session's extracted repository
+            if self._garden_source:
+                shutil.rmtree(os.path.dirname(self._garden_source), ignore_errors=True)
 
 if __name__ == "__main__":
     manager = GardenDeployManager()
@@ -11,9 +11,11 @@ import shutil
 import subprocess
 import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import urllib.request
+import urllib.error
 
 class Colors:
     HEADER = '\033[95m'
@@ -25,11 +27,20 @@ class Colors:
     ENDC = '\033[0m'
     BOLD = '\033[1m'
 
+# Keep redirected output (log files, CI) free of escape codes
+if not sys.stdout.isatty():
+    for _name in ('HEADER', 'OKBLUE', 'OKCYAN', 'OKGREEN', 'WARNING', 'FAIL', 'ENDC', 'BOLD'):
+        setattr(Colors, _name, '')
+
 class GitHubForkManager:
     def __init__(self):
         self.current_dir = Path.cwd()
         self.github_repo = "scottloeb/garden"
         self.github_zip_url = f"https://github.com/{self.github_repo}/archive/refs/heads/main.zip"
+        # Downloaded repository zip and its ETag (shared with deploy-manager.py)
+        self.cache_dir = Path.home() / ".cache" / "garden-deploy"
+        # Extracted repository, shared by every fork in one run() session
+        self._garden_dir = None
         
         # Core files to extract from GitHub
         self.core_files = [
@@ -43,6 +54,9 @@ class GitHubForkManager:
             'requirements.txt',
             '.gitignore'
         ]
+        # Archive path matchers: directory prefixes for startswith, exact names for files
+        self._core_dir_prefixes = tuple(f for f in self.core_files if f.endswith('/'))
+        self._core_file_names = frozenset(f for f in self.core_files if not f.endswith('/'))
         
         self.project_templates = {
             'recipe': {
@@ -80,34 +94,79 @@ class GitHubForkManager:
         
         try:
             print("Connecting to GitHub...")
-            with urllib.request.urlopen(self.github_zip_url) as response:
-                size = len(response.read())
+            # HEAD request: check reachability without downloading the archive
+            request = urllib.request.Request(self.github_zip_url, method='HEAD')
+            with urllib.request.urlopen(request) as response:
+                size = response.headers.get('Content-Length')
                 print(f"{Colors.OKGREEN}✅ Connection successful!{Colors.ENDC}")
-                print(f"Repository size: {size:,} bytes")
+                if size:
+                    print(f"Repository size: {int(size):,} bytes")
+                else:
+                    print("Repository size: not reported (archive is generated on request)")
                 return True
         except Exception as e:
             print(f"{Colors.FAIL}❌ Connection failed: {str(e)}{Colors.ENDC}")
             return False
 
+    def _fetch_garden_zip(self):
+        """Fetch the repository zip into the cache, reusing it when GitHub reports no change"""
+        zip_path = self.cache_dir / "garden-main.zip"
+        etag_path = self.cache_dir / "garden-main.etag"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        request = urllib.request.Request(self.github_zip_url)
+        if zip_path.is_file() and etag_path.is_file():
+            request.add_header('If-None-Match', etag_path.read_text().strip())
+        
+        try:
+            with urllib.request.urlopen(request) as response:
+                # Stream into a temp file, then swap in so a failed download keeps the old cache
+                with tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix='.zip', delete=False) as tmp_file:
+                    try:
+                        shutil.copyfileobj(response, tmp_file, 1024 * 1024)
+                    except BaseException:
+                        os.unlink(tmp_file.name)
+                        raise
+                os.replace(tmp_file.name, zip_path)
+                etag = response.headers.get('ETag')
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            print("✓ Cached repository is up to date")
+            return zip_path
+        
+        if etag:
+            etag_path.write_text(etag)
+        elif etag_path.exists():
+            etag_path.unlink()
+        return zip_path
+
     def download_garden_repo(self):
         """Download the latest GARDEN repository from GitHub"""
+        # Reuse the copy already extracted this session (removed when run() exits)
+        if self._garden_dir and self._garden_dir.is_dir():
+            print(f"\n{Colors.OKCYAN}📥 Using GARDEN repository from this session{Colors.ENDC}")
+            return self._garden_dir
+        
         print(f"\n{Colors.OKCYAN}📥 Downloading latest GARDEN repository...{Colors.ENDC}")
         
         # Create temporary directory
         temp_dir = tempfile.mkdtemp(prefix="garden_download_")
-        zip_path = Path(temp_dir) / "garden.zip"
         extract_path = Path(temp_dir) / "extracted"
         
         try:
-            # Download repository zip
+            # Download repository zip (reused from cache when unchanged)
             print("Downloading repository...")
-            urllib.request.urlretrieve(self.github_zip_url, zip_path)
+            zip_path = self._fetch_garden_zip()
             print(f"✓ Downloaded to {zip_path}")
             
-            # Extract zip
+            # Extract only the core files (entries sit under a garden-<branch>/ prefix)
             print("Extracting repository...")
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_path)
+                for member in zip_ref.infolist():
+                    rel_path = member.filename.partition('/')[2]
+                    if rel_path.startswith(self._core_dir_prefixes) or rel_path in self._core_file_names:
+                        zip_ref.extract(member, extract_path)
             
             # Find the extracted garden directory (usually garden-main/)
             extracted_dirs = list(extract_path.glob("garden-*"))
@@ -117,6 +176,7 @@ class GitHubForkManager:
             garden_dir = extracted_dirs[0]
             print(f"✓ Extracted to {garden_dir}")
             
+            self._garden_dir = garden_dir
             return garden_dir
             
         except Exception as e:
@@ -175,9 +235,6 @@ class GitHubForkManager:
             # Create metadata
             self._create_metadata(project_dir, project_name, template_key)
             
-            # Cleanup
-            shutil.rmtree(garden_dir.parent.parent, ignore_errors=True)
-            
             print(f"\n{Colors.OKGREEN}✅ Successfully forked {project_name}!{Colors.ENDC}")
             print(f"{Colors.OKCYAN}📁 Location: {project_dir}{Colors.ENDC}")
             print(f"{Colors.OKCYAN}📄 Core files: {copied_count}{Colors.ENDC}")
@@ -192,28 +249,40 @@ class GitHubForkManager:
         """Copy core files from downloaded garden repo"""
         print(f"{Colors.OKCYAN}📋 Copying core GARDEN files...{Colors.ENDC}")
         
-        copied_count = 0
+        # Entries are independent, so copy them concurrently and report in list order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(
+                lambda core_pattern: self._copy_core_entry(garden_dir, project_dir, core_pattern),
+                self.core_files))
         
-        for core_pattern in self.core_files:
-            source_path = garden_dir / core_pattern.rstrip('/')
-            dest_path = project_dir / core_pattern.rstrip('/')
-            
-            if source_path.exists():
-                if source_path.is_file():
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(source_path, dest_path)
-                    print(f"  ✓ {core_pattern}")
-                    copied_count += 1
-                elif source_path.is_dir():
-                    shutil.copytree(source_path, dest_path)
-                    file_count = len(list(dest_path.rglob('*')))
-                    print(f"  ✓ {core_pattern} ({file_count} files)")
-                    copied_count += file_count
-            else:
-                print(f"  ⚠️ Not found: {core_pattern}")
+        copied_count = 0
+        for message, count in results:
+            print(message)
+            copied_count += count
         
         return copied_count
 
+    def _copy_core_entry(self, garden_dir, project_dir, core_pattern):
+        """Copy one core file or directory, returning its report line and file count"""
+        source_path = garden_dir / core_pattern.rstrip('/')
+        dest_path = project_dir / core_pattern.rstrip('/')
+        
+        if source_path.is_file():
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source_path, dest_path)
+            return f"  ✓ {core_pattern}", 1
+        elif source_path.is_dir():
+            # Count files as copytree copies them instead of re-walking the copy
+            copied = []
+            def copy_and_count(src, dst):
+                copied.append(dst)
+                return shutil.copy2(src, dst)
+            shutil.copytree(source_path, dest_path, copy_function=copy_and_count)
+            file_count = len(copied)
+            return f"  ✓ {core_pattern} ({file_count} files)", file_count
+        else:
+            return f"  ⚠️ Not found: {core_pattern}", 0
+
     def _create_starter_app(self, project_dir, template_key, template):
         """Create template-specific starter application"""
         print(f"{Colors.OKCYAN}🎯 Creating {template['name']}...{Colors.ENDC}")
@@ -281,7 +350,8 @@ class GitHubForkManager:
             'github_fork': True
         }
         
-        (project_dir / ".garden-project.json").write_text(json.dumps(metadata, indent=2))
+        with open(project_dir / ".garden-project.json", 'w') as f:
+            json.dump(metadata, f, indent=2)
         print(f"  ✓ Project metadata created")
 
     def run(self):
@@ -291,23 +361,28 @@ class GitHubForkManager:
         print("=" * 50)
         print(f"{Colors.ENDC}")
         
-        while True:
-            print(f"\n{Colors.OKBLUE}Options:{Colors.ENDC}")
-            print("0. 🌱 Fork New Project from GitHub")
-            print("1. 🔍 Test GitHub Connection")
-            print("q. Exit")
-            
-            choice = input(f"\n{Colors.OKBLUE}Choice: {Colors.ENDC}").strip().lower()
-            
-            if choice == 'q':
-                print("🌱 Happy gardening!")
-                break
-            elif choice == '0':
-                self.fork_garden_project()
-            elif choice == '1':
-                self.test_github_connection()
-            else:
-                print(f"{Colors.FAIL}❌ Invalid choice{Colors.ENDC}")
+        try:
+            while True:
+                print(f"\n{Colors.OKBLUE}Options:{Colors.ENDC}")
+                print("0. 🌱 Fork New Project from GitHub")
+                print("1. 🔍 Test GitHub Connection")
+                print("q. Exit")
+                
+                choice = input(f"\n{Colors.OKBLUE}Choice: {Colors.ENDC}").strip().lower()
+                
+                if choice == 'q':
+                    print("🌱 Happy gardening!")
+                    break
+                elif choice == '0':
+                    self.fork_garden_project()
+                elif choice == '1':
+                    self.test_github_connection()
+                else:
+                    print(f"{Colors.FAIL}❌ Invalid choice{Colors.ENDC}")
+        finally:
+            # Remove the session's download directory
+            if self._garden_dir:
+                shutil.rmtree(self._garden_dir.parent.parent, ignore_errors=True)
 
 if __name__ == "__main__":
     manager = GitHubForkManager()